@@ -1,17 +1,17 @@
-from argparse import ArgumentParser, ArgumentTypeError
-from pathlib import Path
+from __future__ import annotations
 
-from rich.console import Console
-from rich.traceback import Traceback
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from . import __version__
-from .utils.AssetExtracter import AssetExtracter
-from .utils.FlatbufGenerator import FlatbufGenerator
-from .utils.ResourceDownloader import ResourceDownloader
-from .utils.StudioExtracter import AssetStudioExtracter
-from .utils.TableExtracter import TableExtracter
-from .utils.MediaExtracter import MediaExtracter
-from .utils.CatalogList import CatalogList
+
+if TYPE_CHECKING:
+    from .utils.AssetExtracter import AssetExtracter
+    from .utils.ResourceDownloader import ResourceDownloader
+    from .utils.StudioExtracter import AssetStudioExtracter
+    from .utils.TableExtracter import TableExtracter
+    from .utils.MediaExtracter import MediaExtracter
 
 
 def arguments() -> tuple:  # sourcery skip: extract-duplicate-method
@@ -152,35 +152,21 @@ def arguments() -> tuple:  # sourcery skip: extract-duplicate-method
 
     args = parser.parse_args()
 
-    if (
-        hasattr(args, 'commands')
-        and args.commands in ['download', 'extract']
-        and (args.all and (getattr(args, 'assets', 0) or getattr(args, 'iosassets', 0) or getattr(args, 'androidassets', 0) or args.tables or args.media))
-    ):
-        console = Console(stderr=True)
-        console.print(
-            Traceback.from_exception(
-                type(ArgumentTypeError),
-                ArgumentTypeError("'--all' cannot be used with other download options"),
-                None,
-            )
-        )
-        raise SystemExit(1)
-
-    if hasattr(args, 'commands') and args.commands == 'extract' and sum([int(getattr(args, 'assets', 0) or getattr(args, 'iosassets', 0) or getattr(args, 'androidassets', 0)), args.tables, args.media]) > 1:
-        console = Console(stderr=True)
-        console.print(
-            Traceback.from_exception(
-                type(ArgumentTypeError),
-                ArgumentTypeError("Cannot use multiple extract options together (--assets, --tables, --media)"),
-                None,
-            )
-        )
-        raise SystemExit(1)
+    if args.commands in ['download', 'extract']:
+        assets = getattr(args, 'assets', False) or getattr(args, 'iosassets', False) or getattr(args, 'androidassets', False)
+
+        if args.all and (assets or args.tables or args.media):
+            parser.error("'--all' cannot be used with other download options")
+
+        if args.commands == 'extract' and sum([bool(assets), args.tables, args.media]) > 1:
+            parser.error("Cannot use multiple extract options together (--assets, --tables, --media)")
+
     return parser, args
 
 
 def resource_downloader(args) -> ResourceDownloader:
+    from .utils.ResourceDownloader import ResourceDownloader
+
     downloader_args = {
         'update': args.update,
         'catalog_url': args.catalog,
@@ -214,21 +200,29 @@ def extracter(args) -> TableExtracter | AssetExtracter | AssetStudioExtracter |
         args.media = True
 
     if args.tables:
+        from .utils.TableExtracter import TableExtracter
+
         table_extract = TableExtracter(args.path)
         table_extract.run_extraction()
         return table_extract
 
     if args.assets and not args.studio:
+        from .utils.AssetExtracter import AssetExtracter
+
         asset_extract = AssetExtracter(args.path)
         asset_extract.extract_assets()
         return asset_extract
 
     if args.assets and args.studio:
+        from .utils.StudioExtracter import AssetStudioExtracter
+
         asset_studio_extract = AssetStudioExtracter(args.path)
         asset_studio_extract.extract_assets()
         return asset_studio_extract
 
     if args.media:
+        from .utils.MediaExtracter import MediaExtracter
+
         media_extract = MediaExtracter(args.path)
         media_extract.run_extraction()
         return media_extract
@@ -251,6 +245,10 @@ def main() -> None:
         return
         
     if args.commands == 'search':
+        from rich.console import Console
+
+        from .utils.CatalogList import CatalogList
+
         root_path = Path(__file__).parent
         output_path = args.output if hasattr(args, 'output') and args.output else None
         version = args.version if hasattr(args, 'version') and args.version else None
@@ -272,10 +270,14 @@ def main() -> None:
         return
 
     if args.update:
+        from .utils.ResourceDownloader import ResourceDownloader
+
         ResourceDownloader(update=args.update).fetch_catalog_url()
         return
 
     if args.generate:
+        from .utils.FlatbufGenerator import FlatbufGenerator
+
         FlatbufGenerator().generate()
         return
 
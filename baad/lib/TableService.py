@@ -1,22 +1,88 @@
+import sys
 from base64 import b64encode
 from io import BytesIO
 from pathlib import Path
-from typing import Union
-from zipfile import ZipFile
+from typing import Callable, Union
+from zipfile import ZipExtFile, ZipFile
 
 from .MersenneTwister import MersenneTwister
 from .XXHashService import calculate_hash
 
 
+def _generate_crc(crc: int) -> int:
+    for _ in range(8):
+        crc = (crc >> 1) ^ 0xEDB88320 if crc & 1 else crc >> 1
+    return crc
+
+
+CRC_TABLE = tuple(map(_generate_crc, range(256)))
+KEY_STREAM = bytes(((k | 2) * ((k | 2) ^ 1) >> 8) & 0xFF for k in range(1 << 16))
+
+# TableZipExtFile overrides ZipExtFile._init_decrypter, which is only known to behave this way on these versions
+FAST_DECRYPT = (3, 10) <= sys.version_info[:2] <= (3, 12) and hasattr(ZipExtFile, '_init_decrypter')
+
+
+def _derive_keys(password: bytes) -> tuple[int, int, int]:
+    crc_table = CRC_TABLE
+    key0, key1, key2 = 305419896, 591751049, 878082192
+
+    for c in password:
+        key0 = (key0 >> 8) ^ crc_table[(key0 ^ c) & 0xFF]
+        key1 = ((key1 + (key0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+        key2 = (key2 >> 8) ^ crc_table[(key2 ^ (key1 >> 24)) & 0xFF]
+
+    return key0, key1, key2
+
+
+def _zip_decrypter(keys: tuple[int, int, int]) -> Callable[[bytes], bytes]:
+    crc_table, key_stream = CRC_TABLE, KEY_STREAM
+    key0, key1, key2 = keys
+
+    def decrypter(data: bytes) -> bytes:
+        nonlocal key0, key1, key2
+        k0, k1, k2 = key0, key1, key2
+        result = bytearray()
+        append = result.append
+
+        for c in data:
+            c ^= key_stream[k2 & 0xFFFF]
+            append(c)
+            k0 = (k0 >> 8) ^ crc_table[(k0 ^ c) & 0xFF]
+            k1 = ((k1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+            k2 = (k2 >> 8) ^ crc_table[(k2 ^ (k1 >> 24)) & 0xFF]
+
+        key0, key1, key2 = k0, k1, k2
+        return bytes(result)
+
+    return decrypter
+
+
+class TableZipExtFile(ZipExtFile):
+    keys: tuple[int, int, int]
+
+    def _init_decrypter(self) -> int:
+        # Same as ZipExtFile._init_decrypter with the table-driven decrypter, so backward seeks reuse it too
+        self._decrypter = _zip_decrypter(self.keys)
+        header = self._fileobj.read(12)
+        self._compress_left -= 12
+        return self._decrypter(header)[11]
+
+    def _restart_decrypter(self, keys: tuple[int, int, int]) -> None:
+        self.keys = keys
+        self._fileobj.seek(self._orig_compress_start)
+        self._compress_left = self._orig_compress_size
+        self._init_decrypter()
+
+
 class TableZipFile(ZipFile):
     def __init__(self, file: Union[str, BytesIO], password: bytes = None) -> None:
         super().__init__(file)
-        if password is not None:
-            self.password = password
-            return
-            
-        file_name = Path(file).name if isinstance(file, str) else file.name
-        self.password = self._generate_password(file_name.lower())
+        if password is None:
+            file_name = Path(file).name if isinstance(file, str) else file.name
+            password = self._generate_password(file_name.lower())
+
+        self.password = password
+        self._keys = _derive_keys(password)
 
     def _generate_password(self, file_name: str) -> bytes:
         hash_value = calculate_hash(file_name)
@@ -25,4 +91,10 @@ class TableZipFile(ZipFile):
         return b64encode(next_bytes)
 
     def open(self, name: str, mode: str = 'r', force_zip64: bool = False) -> bytes:
-        return super().open(name, mode, pwd=self.password, force_zip64=force_zip64)
+        ext_file = super().open(name, mode, pwd=self.password, force_zip64=force_zip64)
+
+        if FAST_DECRYPT and mode == 'r' and ext_file._decrypter is not None and ext_file.seekable():
+            ext_file.__class__ = TableZipExtFile
+            ext_file._restart_decrypter(self._keys)
+
+        return ext_file
@@ -1,5 +1,9 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from zipfile import ZipFile
+from typing import BinaryIO, Callable
+from zipfile import ZipFile, ZipInfo
 
 import cloudscraper
 import requests
@@ -10,6 +14,20 @@ from .Progress import create_live_display, create_progress_group
 from .. import __app_name__, __app_author__
 from .CatalogParser import CatalogParser
 
+CHUNK_SIZE = 1 << 20
+RANGE_COUNT = 8
+
+
+class ProgressWriter:
+    def __init__(self, file: BinaryIO, advance: Callable[[int], None]) -> None:
+        self.file = file
+        self.advance = advance
+
+    def write(self, data: bytes) -> int:
+        written = self.file.write(data)
+        self.advance(len(data))
+        return written
+
 
 class ApkParser:
     def __init__(self, apk_url: str | None = None, apk_path: str | None = None, version: str | None = None) -> None:
@@ -30,9 +48,13 @@ class ApkParser:
         
         self.version_dir = self.cache_dir / self.version
         self.version_dir.mkdir(parents=True, exist_ok=True)
-        self.apk_path = apk_path or self.version_dir / 'BlueArchive.xapk'
+        self.apk_path = Path(apk_path) if apk_path else self.version_dir / 'BlueArchive.xapk'
+        self._apk_parent = self.apk_path.parent
+        self._apk_folder = self._apk_parent / 'apk'
+        self._data_folder = self._apk_parent / 'data'
         
         self.apk_url = apk_url or self._get_apk_url()
+        self._remote_size = None
         self.live = create_live_display()
 
 
@@ -46,10 +68,22 @@ class ApkParser:
         version_code = self._extract_version_code(self.version)
         
         urls_to_try = self._build_url_list(base_url, app_id, self.version, version_code)
-        
-        for url in urls_to_try:
-            if valid_url := self._check_url_validity(url):
-                return valid_url
+
+        executor = ThreadPoolExecutor(max_workers=len(urls_to_try))
+        futures = [executor.submit(self._check_url_validity, url) for url in urls_to_try]
+
+        try:
+            for url, future in zip(urls_to_try, futures):
+                if failure := future.result():
+                    self.console.print(failure)
+                    continue
+
+                url_type, param_type = self._describe_url(url)
+                self.console.print(f"[cyan]Using {url_type} format with {param_type} for version {self.version}[/cyan]")
+                return url
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         self.console.print(f"[yellow]Could not determine format for version {self.version}, using latest[/yellow]")
         return f'{base_url}/XAPK/{app_id}?version=latest'
@@ -77,32 +111,42 @@ class ApkParser:
         
         return versioncode_urls + version_urls
 
-    def _check_url_validity(self, url: str) -> str | None:
+    @staticmethod
+    def _describe_url(url: str) -> tuple[str, str]:
+        url_type = "APK" if "/APK/" in url else "XAPK"
+        param_type = "versionCode" if "versionCode" in url else "version"
+        return url_type, param_type
+
+    def _is_html_response(self, url: str) -> bool:
+        response = self.scraper.head(url, allow_redirects=True, timeout=10)
+        content_type = response.headers.get('content-type', '')
+
+        if response.ok and content_type:
+            return 'text/html' in content_type.lower()
+
+        response = self.scraper.get(url, stream=True, timeout=10)
         try:
-            response = self.scraper.get(url, stream=True, timeout=10)
             content_start = next(response.iter_content(256), b'')
-            
-            html_markers = [b'<!DOCTYPE', b'<html', b'<HTML']
-            is_html = any(marker in content_start for marker in html_markers)
-            
-            if not is_html:
-                url_type = "APK" if "/APK/" in url else "XAPK"
-                param_type = "versionCode" if "versionCode" in url else "version"
-                self.console.print(f"[cyan]Using {url_type} format with {param_type} for version {self.version}[/cyan]")
-                return url
-            
-            url_type = "APK" if "/APK/" in url else "XAPK"
-            param_type = "versionCode" if "versionCode" in url else "version"
-            self.console.print(f"[yellow]{url_type} URL with {param_type} returned HTML, trying next option...[/yellow]")
-            
+        finally:
+            response.close()
+
+        html_markers = [b'<!DOCTYPE', b'<html', b'<HTML']
+        return any(marker in content_start for marker in html_markers)
+
+    def _check_url_validity(self, url: str) -> str | None:
+        try:
+            if not self._is_html_response(url):
+                return None
+
+            url_type, param_type = self._describe_url(url)
+            return f"[yellow]{url_type} URL with {param_type} returned HTML, trying next option...[/yellow]"
+
         except Exception as e:
-            self.console.print(f"[yellow]Error checking URL {url}: {str(e)}[/yellow]")
-        
-        return None
+            return f"[yellow]Error checking URL {url}: {str(e)}[/yellow]"
 
     @staticmethod
-    def _get_files(zip: ZipFile) -> set:
-        return {file_info for file_info in zip.infolist() if not file_info.is_dir()}
+    def _get_files(zip: ZipFile) -> list[ZipInfo]:
+        return [file_info for file_info in zip.infolist() if file_info.filename[-1:] != '/']
 
     def _get_response(self) -> requests.Response | SystemExit:
         try:
@@ -113,21 +157,98 @@ class ApkParser:
             self.console.log(f'[bold red]{str(e)}[/bold red]')
             raise SystemExit(1) from e
 
+    def _download_stream(self, response: requests.Response, apk_path: Path, download_task: int) -> None:
+        def advance(size: int) -> None:
+            self.download_progress.update(download_task, advance=size)
+            self.live.update(self.progress_group)
+
+        response.raw.decode_content = True
+        with open(apk_path, 'wb') as f:
+            shutil.copyfileobj(response.raw, ProgressWriter(f, advance), length=CHUNK_SIZE)
+
+    def _download_ranges(self, url: str, apk_path: Path, total_size: int, download_task: int) -> None:
+        lock = threading.Lock()
+        failed = threading.Event()
+        step = -(-total_size // RANGE_COUNT)
+        ranges = [(start, min(start + step, total_size) - 1) for start in range(0, total_size, step)]
+        part_path = apk_path.with_name(f'{apk_path.name}.part')
+
+        with open(part_path, 'wb') as f:
+            f.truncate(total_size)
+
+        def download_range(start: int, end: int) -> None:
+            if failed.is_set():
+                return
+
+            response = self.scraper.get(url, headers={'Range': f'bytes={start}-{end}'}, stream=True, timeout=60)
+            bytes_downloaded = 0
+
+            try:
+                response.raise_for_status()
+
+                if response.status_code != 206:
+                    raise requests.exceptions.RequestException(f'Range request ignored by server for {url}')
+
+                with open(part_path, 'r+b') as f:
+                    f.seek(start)
+
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        if failed.is_set():
+                            return
+
+                        f.write(chunk)
+                        bytes_downloaded += len(chunk)
+
+                        with lock:
+                            self.download_progress.update(download_task, advance=len(chunk))
+                            self.live.update(self.progress_group)
+
+            finally:
+                response.close()
+
+            if bytes_downloaded != end - start + 1:
+                raise requests.exceptions.RequestException(f'Incomplete range {start}-{end} for {url}')
+
+        executor = ThreadPoolExecutor(max_workers=RANGE_COUNT)
+        futures = [executor.submit(download_range, start, end) for start, end in ranges]
+
+        try:
+            for future in as_completed(futures):
+                future.result()
+
+        except BaseException:
+            failed.set()
+            raise
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+            if failed.is_set():
+                part_path.unlink(missing_ok=True)
+
+        os.replace(part_path, apk_path)
+
     def _download_file(self, response: requests.Response) -> None:
         total_size = int(response.headers.get('content-length', 0))
         download_task = self.download_progress.add_task('[red]Downloading APK...', total=total_size)
 
-        apk_path = Path(self.apk_path)
-        apk_path.parent.mkdir(parents=True, exist_ok=True)
+        apk_path = self.apk_path
+        self._apk_parent.mkdir(parents=True, exist_ok=True)
 
         with self.live:
-            with open(apk_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            if total_size and response.headers.get('accept-ranges', '').lower() == 'bytes':
+                response.close()
 
-                    self.download_progress.update(download_task, advance=len(chunk))
-                    self.live.update(self.progress_group)
+                try:
+                    self._download_ranges(response.url, apk_path, total_size, download_task)
+
+                except (ConnectionError, TimeoutError, requests.exceptions.RequestException) as e:
+                    self.console.print(f'[yellow]Ranged download failed ({str(e)}), retrying as a single stream...[/yellow]')
+                    self.download_progress.reset(download_task, total=total_size)
+                    self._download_stream(self._get_response(), apk_path, download_task)
+
+            else:
+                self._download_stream(response, apk_path, download_task)
 
             self.download_progress.update(download_task, description='[green]APK downloaded...')
             self.live.update(self.progress_group)
@@ -139,19 +260,24 @@ class ApkParser:
             self._download_file(response)
 
     def _delete_outdated_files(self) -> None:
-        xapk_path = Path(self.apk_path)
-        apk_folder = xapk_path.parent / 'apk'
-        data_folder = xapk_path.parent / 'data'
-
-        for folder in [apk_folder, data_folder]:
+        for folder in [self._apk_folder, self._data_folder]:
             if folder.exists():
                 shutil.rmtree(folder)
                 self.console.print(f"[yellow]Deleted outdated folder: {folder}[/yellow]")
 
     def _fetch_size(self) -> int:
+        if self._remote_size is not None:
+            return self._remote_size
+
         try:
-            response = self.scraper.get(self.apk_url, stream=True, timeout=60)
-            return int(response.headers.get('content-length', 0))
+            response = self.scraper.head(self.apk_url, allow_redirects=True, timeout=60)
+
+            if not response.ok or 'content-length' not in response.headers:
+                response = self.scraper.get(self.apk_url, stream=True, timeout=60)
+                response.close()
+
+            self._remote_size = int(response.headers.get('content-length', 0))
+            return self._remote_size
 
         except (ConnectionError, TimeoutError, requests.exceptions.RequestException) as e:
             self.console.log(f'[bold red]Error: {str(e)}[/bold red]')
@@ -169,30 +295,64 @@ class ApkParser:
             extract = self._get_files(zip)
             self._extract_files(zip, extract, extract_path)
 
-    def _extract_files(self, zip: ZipFile, extract: set, extract_path: Path) -> None:
+    @staticmethod
+    def _member_parent(filename: str) -> str:
+        # Clean the name the way ZipFile._extract_member does, so this is the directory extract() writes into
+        arcname = filename.replace('/', os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+
+        arcname = os.path.splitdrive(arcname)[1]
+        arcname = os.path.sep.join(part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir))
+        if os.path.sep == '\\':
+            arcname = ZipFile._sanitize_windows_name(arcname, os.path.sep)
+
+        return os.path.dirname(arcname)
+
+    def _extract_files(self, zip: ZipFile, extract: list[ZipInfo], extract_path: Path) -> None:
         extract_task = self.extract_progress.add_task('[green]Extracting...', total=len(extract))
 
-        with self.live:
-            for file_info in extract:
-                target_path = Path(self.apk_path).parent / 'data' / Path(file_info.filename)
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+        local = threading.local()
+        lock = threading.Lock()
+        handles = []
+
+        def extract_member(file_info: ZipInfo) -> None:
+            if not hasattr(local, 'zip'):
+                local.zip = ZipFile(zip.filename, 'r')
+                with lock:
+                    handles.append(local.zip)
+
+            local.zip.extract(file_info, extract_path)
+
+        for parent in {self._member_parent(file_info.filename) for file_info in extract}:
+            (extract_path / parent).mkdir(parents=True, exist_ok=True)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2)) as executor:
+                futures = [executor.submit(extract_member, file_info) for file_info in extract]
 
-                zip.extract(file_info, extract_path)
+                for future in as_completed(futures):
+                    future.result()
 
-                self.extract_progress.update(extract_task, advance=1)
-                self.live.update(self.progress_group)
+                    with lock:
+                        self.extract_progress.update(extract_task, advance=1)
+                        self.live.update(self.progress_group)
 
             self.extract_progress.update(extract_task, description='[green]APK Extracted...')
             self.live.update(self.progress_group)
 
-    def _extract_regular_apk(self, file_path: Path, data_folder: Path) -> None:
+        finally:
+            for handle in handles:
+                handle.close()
+
+    def _extract_regular_apk(self, zip: ZipFile, data_folder: Path) -> None:
         self.console.print("[cyan]Detected regular APK format. Extracting...[/cyan]")
-        self._parse_zipfile(file_path, data_folder)
+        self._extract_files(zip, self._get_files(zip), data_folder)
 
-    def _extract_xapk(self, file_path: Path, apk_folder: Path, data_folder: Path) -> None:
+    def _extract_xapk(self, zip: ZipFile, apk_folder: Path, data_folder: Path) -> None:
         self.console.print("[cyan]Detected XAPK format. Extracting...[/cyan]")
         
-        self._parse_zipfile(file_path, apk_folder)
+        self._extract_files(zip, self._get_files(zip), apk_folder)
         
         apk_files = {
             'unity': apk_folder / 'UnityDataAssetPack.apk',
@@ -200,45 +360,37 @@ class ApkParser:
         }
         
         for apk_type, apk_path in apk_files.items():
+            if not apk_path.exists():
+                self.console.print(f"[yellow]Warning: {apk_path.name} not found in XAPK[/yellow]")
+
+        # Split APKs share names like AndroidManifest.xml, so extract them in order to let the base APK's copy win
+        for apk_path in apk_files.values():
             if apk_path.exists():
                 self._parse_zipfile(apk_path, data_folder)
-                continue
-            
-            self.console.print(f"[yellow]Warning: {apk_path.name} not found in XAPK[/yellow]")
 
-    def _is_regular_apk(self, file_path: Path) -> bool:
-        try:
-            with ZipFile(file_path, 'r') as zip_file:
-                file_list = zip_file.namelist()
-                
-                xapk_indicators = ['manifest.json', 'com.YostarJP.BlueArchive.apk', 'UnityDataAssetPack.apk']
-                if any(indicator in file_list for indicator in xapk_indicators):
-                    return False
-                
-                apk_indicators = ['AndroidManifest.xml', 'classes.dex', 'resources.arsc']
-                has_apk_indicators = any(
-                    any(entry.endswith(indicator) for entry in file_list) 
-                    for indicator in apk_indicators
-                )
-                
-                return has_apk_indicators or file_path.suffix.lower() == '.apk'
-                
-        except Exception as e:
-            self.console.print(f"[yellow]Warning: Error checking APK format: {str(e)}[/yellow]")
+    @staticmethod
+    def _is_regular_apk(file_path: Path, file_list: set[str]) -> bool:
+        xapk_indicators = {'manifest.json', 'com.YostarJP.BlueArchive.apk', 'UnityDataAssetPack.apk'}
+        if not xapk_indicators.isdisjoint(file_list):
             return False
+        
+        apk_indicators = ('AndroidManifest.xml', 'classes.dex', 'resources.arsc')
+        has_apk_indicators = any(entry.endswith(apk_indicators) for entry in file_list)
+        
+        return has_apk_indicators or file_path.suffix.lower() == '.apk'
 
     def compare_apk(self) -> bool:
         remote_size = self._fetch_size()
         if remote_size is None:
             return False
 
-        local_size = Path(self.apk_path).stat().st_size
+        local_size = self.apk_path.stat().st_size
         self._log_size(local_size, remote_size)
 
         return local_size < remote_size
 
     def download_apk(self, update: bool = False) -> None:
-        if update or not Path(self.apk_path).exists():
+        if update or not self.apk_path.exists():
             self._force_download()
             self.extract_apk()
             return
@@ -249,15 +401,15 @@ class ApkParser:
 
         self.extract_apk()
     def extract_apk(self) -> None:
-        file_path = Path(self.apk_path)
-        apk_folder = file_path.parent / 'apk'
-        data_folder = file_path.parent / 'data'
+        file_path = self.apk_path
+        apk_folder = self._apk_folder
+        data_folder = self._data_folder
         
         data_folder.mkdir(parents=True, exist_ok=True)
         
-        if self._is_regular_apk(file_path):
-            self._extract_regular_apk(file_path, data_folder)
-            return
-            
-        self._extract_xapk(file_path, apk_folder, data_folder)
-
+        with self.live, ZipFile(file_path, 'r') as zip:
+            if self._is_regular_apk(file_path, set(zip.namelist())):
+                self._extract_regular_apk(zip, data_folder)
+                return
+                
+            self._extract_xapk(zip, apk_folder, data_folder)
@@ -1,31 +1,64 @@
 import json
+import mmap
+import os
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
+
 from platformdirs import user_data_dir
 
 from ..lib.TableEncryptionService import TableEncryptionService
 from .. import __app_name__, __app_author__
 
 
+def _walk_files(root: Path | str) -> Iterator[str]:
+    stack = [root]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+
+def _scan_file(config_file: str, pattern: bytes) -> bytes | None:
+    try:
+        if os.path.getsize(config_file) < len(pattern) + 2:
+            return None
+
+        with open(config_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start_index = mm.find(pattern)
+
+            if start_index >= 0:
+                return mm[start_index + len(pattern):-2]
+
+    except Exception as e:
+        print(f"Error reading file {config_file}: {e}")
+
+    return None
+
+
 def _search_for_pattern(path: Path, pattern: bytes) -> bytes | None:
     if not path.exists():
         return None
-        
-    for config_file in path.rglob('*'):
-        if not config_file.is_file():
-            continue
-            
-        try:
-            content = config_file.read_bytes()
-
-            if pattern in content:
-                start_index = content.index(pattern)
-                data = content[start_index + len(pattern):]
-                return data[:-2]
-            
-        except Exception as e:
-            print(f"Error reading file {config_file}: {e}")
-    
+
+    config_files = list(_walk_files(path))
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(_scan_file, config_file, pattern) for config_file in config_files]
+
+        for future in as_completed(futures):
+            if (result := future.result()) is not None:
+                for pending in futures:
+                    pending.cancel()
+
+                return result
+
     return None
 
 
@@ -34,18 +67,19 @@ def _get_cache_paths(cache_base: Path, existing_paths: list) -> list:
         return []
         
     cache_paths = []
-    for version_dir in cache_base.iterdir():
-        if not version_dir.is_dir():
-            continue
-            
-        cache_path = version_dir / 'data' / 'assets' / 'bin' / 'Data'
-        if not cache_path.exists():
-            continue
-            
-        if cache_path in [p[1] for p in existing_paths]:
-            continue
-            
-        cache_paths.append((f"Cache ({version_dir.name})", cache_path))
+    with os.scandir(cache_base) as version_dirs:
+        for version_dir in version_dirs:
+            if not version_dir.is_dir():
+                continue
+
+            cache_path = Path(version_dir.path) / 'data' / 'assets' / 'bin' / 'Data'
+            if not cache_path.exists():
+                continue
+
+            if cache_path in [p[1] for p in existing_paths]:
+                continue
+
+            cache_paths.append((f"Cache ({version_dir.name})", cache_path))
     
     return cache_paths
 
@@ -79,16 +113,23 @@ def find_game_config(version: str = None) -> None | bytes:
     return None
 
 
+@lru_cache(maxsize=None)
+def _get_keys() -> tuple[TableEncryptionService, bytes, bytes]:
+    encryption_service = TableEncryptionService()
+    return (
+        encryption_service,
+        encryption_service.create_key('GameMainConfig'),
+        encryption_service.create_key('ServerInfoDataUrl'),
+    )
+
+
 def decrypt_game_config(data: bytes) -> str:
     if data is None:
         raise ValueError("Game config data is None. Make sure the APK is downloaded and extracted properly.")
         
-    encryption_service = TableEncryptionService()
+    encryption_service, game_config, server_data = _get_keys()
     encoded_data = b64encode(data)
 
-    game_config = encryption_service.create_key('GameMainConfig')
-    server_data = encryption_service.create_key('ServerInfoDataUrl')
-
     decrypted_data = encryption_service.convert_string(encoded_data, game_config)
     loaded_data = json.loads(decrypted_data)
 
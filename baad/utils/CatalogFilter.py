@@ -4,58 +4,77 @@ from pathlib import Path
 from rapidfuzz import process, fuzz
 
 
+def _basename(path: str) -> str:
+    return path[path.rfind('/') + 1:]
+
+
 class CatalogFilter:
     def __init__(self, game_files_path: Path):
         self.game_files_path = game_files_path
         self.score_cutoff = 85
+        self._build_choices()
 
     def _load_game_files(self) -> dict:
         with open(self.game_files_path, 'r') as f:
             return json.load(f)
 
-    def _get_name_from_url(self, url: str) -> str:
-        return Path(url).name
+    def _build_choices(self) -> None:
+        game_files = self._load_game_files()
+
+        self._choices = {
+            'AndroidAssetBundles': {
+                _basename(asset['url']): asset
+                for asset in game_files.get('AndroidAssetBundles', [])
+            },
+            'iOSAssetBundles': {
+                _basename(asset['url']): asset
+                for asset in game_files.get('iOSAssetBundles', [])
+            },
+            'TableBundles': {
+                _basename(table['url']): table
+                for table in game_files.get('TableBundles', [])
+            },
+            'MediaResources': {
+                _basename(media['path']): media
+                for media in game_files.get('MediaResources', [])
+            },
+        }
+        self._names = {category: list(choices.keys()) for category, choices in self._choices.items()}
+        self._datas = {category: list(choices.values()) for category, choices in self._choices.items()}
+        self._lower_names = {category: [name.lower() for name in names] for category, names in self._names.items()}
+        self._results = {}
 
-    def _get_name_from_path(self, path: str) -> str:
-        return Path(path).name
+    def invalidate(self) -> None:
+        self._build_choices()
 
-    def _find_matches(self, pattern: str, choices: dict) -> list:
+    def _find_matches(self, pattern: str, category: str) -> list:
         pattern = pattern.lower()
+        names, datas = self._names[category], self._datas[category]
         matches = [
-            (name, data) 
-            for name, data in choices.items() 
-            if pattern in name.lower()
-        ]
-
-        return matches if matches else [
             (name, data)
+            for lower_name, name, data in zip(self._lower_names[category], names, datas)
+            if pattern in lower_name
+        ]
 
-            for name, data in choices.items()
+        if matches:
+            return matches
 
-            if (
-                match := process.extractOne(
-                    query=pattern,
-                    choices=[name], 
-                    scorer=fuzz.token_sort_ratio,
-                    score_cutoff=self.score_cutoff
-                )
-            )
-        ]
+        hits = process.extract(
+            pattern,
+            names,
+            scorer=fuzz.token_sort_ratio,
+            processor=None,
+            score_cutoff=self.score_cutoff,
+            limit=None
+        )
+        return [(names[index], datas[index]) for index in sorted(index for _, _, index in hits)]
 
     def filter_files(self, pattern: str) -> dict:
-        game_files = self._load_game_files()
-        
-        asset_choices_android = {
-            self._get_name_from_url(asset['url']): asset 
-            for asset in game_files.get('AndroidAssetBundles', [])
-        }
-        asset_choices_ios = {
-            self._get_name_from_url(asset['url']): asset 
-            for asset in game_files.get('iOSAssetBundles', [])
-        }
-        
-        asset_matches_android = self._find_matches(pattern, asset_choices_android)
-        asset_matches_ios = self._find_matches(pattern, asset_choices_ios)
+        if pattern in self._results:
+            return self._results[pattern]
+
+        asset_matches_android = self._find_matches(pattern, 'AndroidAssetBundles')
+        asset_matches_ios = self._find_matches(pattern, 'iOSAssetBundles')
         asset_results_android = [
             {
                 'url': data['url'],
@@ -76,12 +95,8 @@ class CatalogFilter:
 
             for name, data in asset_matches_ios
         ]
-        table_choices = {
-            self._get_name_from_url(table['url']): table
-            for table in game_files.get('TableBundles', [])
-        }
-        
-        table_matches = self._find_matches(pattern, table_choices)
+
+        table_matches = self._find_matches(pattern, 'TableBundles')
         table_results = [
             {
                 'url': data['url'],
@@ -92,12 +107,7 @@ class CatalogFilter:
             for name, data in table_matches
         ]
 
-        media_choices = {
-            self._get_name_from_path(media['path']): media
-            for media in game_files.get('MediaResources', [])
-        }
-        
-        media_matches = self._find_matches(pattern, media_choices)
+        media_matches = self._find_matches(pattern, 'MediaResources')
         media_results = [
             {
                 'url': data['url'],
@@ -109,10 +119,11 @@ class CatalogFilter:
             for name, data in media_matches
         ]
 
-        return {
+        self._results[pattern] = {
             'AndroidAssetBundles': asset_results_android,
             'iOSAssetBundles': asset_results_ios,
-            'TableBundles': table_results, 
+            'TableBundles': table_results,
             'MediaResources': media_results
         }
-        
+        return self._results[pattern]
+
@@ -1,6 +1,9 @@
-import json
+import os
 import sys
+import time
 import asyncio
+from array import array
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Tuple
 
@@ -25,6 +28,11 @@ class CatalogList:
         self.selected_index = 0
         self.scroll_offset = 0
         self.visible_items = self.console.height - 8
+        self._dirty = True
+        self._table_window = None
+        self._table_selected = None
+        self._table = None
+        self._text_cache: Dict[Tuple[str, str, int], Tuple[Text, Text, Text]] = {}
         
         self.downloader = ResourceDownloader(output=output, update=update, version=version, catalog_url=catalog_url)
         self.downloader.fetch_catalog_url()
@@ -32,12 +40,15 @@ class CatalogList:
         self.console.print("[cyan]Fetching catalogs...[/cyan]")
         self.downloader.catalog_parser.fetch_catalogs()
         
+        self._game_files = None
+        self._file_index: Dict[str, Dict[str, dict]] = {}
         game_files_path = self.downloader.catalog_parser.cache_dir / 'GameFiles.json'
         if not game_files_path.exists():
             self.console.print("[yellow]Initializing game files...[/yellow]")
-            self.downloader.initialize_download()
+            self._game_files = self.downloader.initialize_download()
         
         self.all_items = self._load_all_items()
+        self._index_items()
         
     def _format_size(self, size: int) -> str:
         if size == 0:
@@ -48,7 +59,7 @@ class CatalogList:
             size /= 1024
         return f"{size:.1f}TB"
         
-    def _load_catalogs(self) -> Dict[str, List[dict]]:
+    def _load_catalogs(self) -> Dict[str, List[Tuple[str, int]]]:
         cache_dir = self.downloader.catalog_parser.cache_dir
         
         catalog_configs = {
@@ -67,9 +78,8 @@ class CatalogList:
             
         return result
 
-    def _load_catalog_items(self, category: str, path: Path, key: str) -> List[dict]:
-        with open(path) as f:
-            data = json.load(f)
+    def _load_catalog_items(self, category: str, path: Path, key: str) -> List[Tuple[str, int]]:
+        data = self.downloader.catalog_parser._load_json(path)
             
         if category.endswith('AssetBundles'):
             return self._load_asset_bundles(data, key)
@@ -79,24 +89,20 @@ class CatalogList:
             
         return self._load_table_bundles(data, key)
         
-    def _load_asset_bundles(self, data: dict, key: str) -> List[dict]:
+    def _load_asset_bundles(self, data: dict, key: str) -> List[Tuple[str, int]]:
         items = data.get(key, [])
-        return [{'name': item['Name'], 'size': item.get('Size', 0)} for item in items]
+        return [(item['Name'], item.get('Size', 0)) for item in items]
         
-    def _load_media_resources(self, data: dict, key: str) -> List[dict]:
+    def _load_media_resources(self, data: dict, key: str) -> List[Tuple[str, int]]:
         items = data.get(key, {}).values()
-        return [{'name': Path(item['path']).name, 'size': item.get('bytes', 0)} for item in items]
+        basename = os.path.basename
+        return [(basename(item['path']), item.get('bytes', 0)) for item in items]
         
-    def _load_table_bundles(self, data: dict, key: str) -> List[dict]:
+    def _load_table_bundles(self, data: dict, key: str) -> List[Tuple[str, int]]:
         items = data.get(key, {}).items()
-        return [{'name': name, 'size': item_data.get('size', 0)} for name, item_data in items]
+        return [(name, item_data.get('size', 0)) for name, item_data in items]
 
     def _create_table(self, items: List[Tuple[str, str, int]]) -> Table:
-        table = Table(show_header=True, header_style="bold magenta", expand=True, box=None)
-        table.add_column("Category", style="cyan", width=15)
-        table.add_column("Name", style="green")
-        table.add_column("Size", justify="right", style="yellow", width=10)
-
         total_items = len(items)
         self.visible_items = min(self.console.height - 8, total_items)
         
@@ -106,51 +112,113 @@ class CatalogList:
 
         start_idx = self.scroll_offset
         end_idx = min(start_idx + self.visible_items, total_items)
+
+        window = tuple(items[start_idx:end_idx])
+        selected = self.selected_index - start_idx
+
+        if window == self._table_window:
+            if selected != self._table_selected:
+                self._set_row_style(window, self._table_selected, "")
+                self._set_row_style(window, selected, "reverse")
+                self._table_selected = selected
+            return self._table
+
+        table = Table(show_header=True, header_style="bold magenta", expand=True, box=None)
+        table.add_column("Category", style="cyan", width=15)
+        table.add_column("Name", style="green")
+        table.add_column("Size", justify="right", style="yellow", width=10)
         
-        for idx in range(start_idx, end_idx):
-            category, name, size = items[idx]
-            style = "reverse" if idx == self.selected_index else ""
-            size_text = self._format_size(size)
+        for offset, item in enumerate(window):
+            texts = self._row_texts(item)
+            style = "reverse" if offset == selected else ""
+
+            for text in texts:
+                text.style = style
             
-            table.add_row(
-                Text(category, style=style),
-                Text(name, style=style),
-                Text(size_text, style=style)
-            )
+            table.add_row(*texts)
 
+        self._table_window, self._table_selected, self._table = window, selected, table
         return table
 
+    def _row_texts(self, item: Tuple[str, str, int]) -> Tuple[Text, Text, Text]:
+        texts = self._text_cache.get(item)
+        if texts is None:
+            category, name, size = item
+            texts = self._text_cache[item] = (Text(category), Text(name), Text(self._format_size(size)))
+
+        return texts
+
+    def _set_row_style(self, window: Tuple[Tuple[str, str, int], ...], offset: int, style: str) -> None:
+        if not 0 <= offset < len(window):
+            return
+
+        for text in self._row_texts(window[offset]):
+            text.style = style
+
+    @staticmethod
+    def _trigrams(text: str) -> set:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def _index_items(self) -> None:
+        self._lower_names = [name.lower() for _, name, _ in self.all_items]
+        self._last_query = ""
+        self._last_indices = range(len(self.all_items))
+
+        self._trigram_index: Dict[str, array] = {}
+        for index, name in enumerate(self._lower_names):
+            for trigram in self._trigrams(name):
+                postings = self._trigram_index.get(trigram)
+                if postings is None:
+                    postings = self._trigram_index[trigram] = array('i')
+                postings.append(index)
+
+    def _fuzzy_candidates(self, query: str) -> List[int]:
+        trigrams = self._trigrams(query)
+        if not trigrams:
+            return range(len(self.all_items))
+
+        candidates = set()
+        for trigram in trigrams:
+            candidates.update(self._trigram_index.get(trigram, ()))
+
+        return sorted(candidates)
+
+    def _substring_indices(self, query: str) -> List[int]:
+        candidates = self._last_indices if query.startswith(self._last_query) else range(len(self.all_items))
+        lower_names = self._lower_names
+        indices = [index for index in candidates if query in lower_names[index]]
+
+        self._last_query, self._last_indices = query, indices
+        return indices
+
     def _filter_items(self) -> List[Tuple[str, str, int]]:
         if not self.query:
             return self.all_items
             
         query = self.query.lower()
-        filtered_items = []
-        
-        for category, name, size in self.all_items:
-            if query in name.lower():
-                filtered_items.append((category, name, size))
+        filtered_items = [self.all_items[index] for index in self._substring_indices(query)]
                 
         if not filtered_items:
-            choices = [(cat, name) for cat, name, _ in self.all_items]
-            matches = process.extract(
-                query=query,
-                choices=choices,
+            candidates = self._fuzzy_candidates(query)
+            scores = process.cdist(
+                [query],
+                [self._lower_names[index] for index in candidates],
                 scorer=fuzz.token_sort_ratio,
                 score_cutoff=self.score_cutoff,
-                limit=None
-            )
-            filtered_items = [(cat, name, size) for (cat, name), _, _ in matches for _, n, s in [next((i for i in self.all_items if i[0] == cat and i[1] == name), (None, None, 0))]]
+                workers=-1
+            )[0]
+            filtered_items = [self.all_items[candidates[index]] for index in scores.nonzero()[0]]
             
-        return sorted(filtered_items, key=lambda x: x[2], reverse=True)
+        return filtered_items
 
     def _load_all_items(self) -> List[Tuple[str, str, int]]:
         catalogs = self._load_catalogs()
-        return [
-            (category, item['name'], item['size'])
+        items = [
+            (category, name, size)
             for category, items in catalogs.items()
-            for item in items
+            for name, size in items
         ]
+        return sorted(items, key=itemgetter(2), reverse=True)
     
     def _get_char(self) -> str:
         if sys.platform == "win32":
@@ -205,6 +273,8 @@ class CatalogList:
     def _handle_input(self, char: str, live: Live) -> bool:
         if not char:
             return True
+
+        self._dirty = True
             
         if char == '\x1b':  # ESC
             return False
@@ -239,6 +309,18 @@ class CatalogList:
             
         return True
     
+    @staticmethod
+    def _resolve_name(file: dict) -> str:
+        path = file.get('Name') or file.get('path') or file['url']
+        return path[path.rfind('/') + 1:]
+
+    def _get_file_index(self, category: str) -> Dict[str, dict]:
+        if category not in self._file_index:
+            files = self._game_files[category]
+            self._file_index[category] = {self._resolve_name(file): file for file in reversed(files)}
+
+        return self._file_index[category]
+
     def _download_selected_item(self, filtered_items: List[Tuple[str, str, int]], live: Live) -> None:
         if not filtered_items or self.selected_index >= len(filtered_items):
             return
@@ -247,30 +329,19 @@ class CatalogList:
 
         live.stop()
 
-        game_files = self.downloader.initialize_download()
-        
-        selected_file = None
-        category_key = category if category in ['AssetBundles', 'MediaResources', 'TableBundles'] else None
-            
-        if not (category_key and category_key in game_files):
-            return
+        if self._game_files is None:
+            self._game_files = self.downloader.initialize_download()
 
-        for file in game_files[category_key]:
-            file_name = (
-                file.get('Name') or 
-                Path(file.get('path', '')).name or 
-                Path(file['url']).name
-            )
+        if category not in self._game_files:
+            return
 
-            if file_name == name:
-                selected_file = file
-                break
+        selected_file = self._get_file_index(category).get(name)
 
         if selected_file:
-            single_file = {category_key: [selected_file]}    
+            single_file = {category: [selected_file]}    
             asyncio.run(self.downloader._download_all_categories(
                 single_file, 
-                [category_key]
+                [category]
             ))
 
             self._get_char()
@@ -284,18 +355,28 @@ class CatalogList:
             Layout(name="content")
         )
         
-        with Live(layout, console=self.console, screen=True, refresh_per_second=60) as live:
+        content_table = None
+        with Live(layout, console=self.console, screen=True, refresh_per_second=30) as live:
             for _ in iter(bool, True):
-                filtered_items = self._filter_items()
-                
-                layout["search"].update(Panel(
-                    Text(f"> {self.query}", style="bold blue"),
-                    title=f"[{len(filtered_items)} matches] [Press ESC to exit]",
-                    style="blue"
-                ))
+                if self._dirty:
+                    filtered_items = self._filter_items()
+                    
+                    layout["search"].update(Panel(
+                        Text(f"> {self.query}", style="bold blue"),
+                        title=f"[{len(filtered_items)} matches] [Press ESC to exit]",
+                        style="blue"
+                    ))
+                    
+                    table = self._create_table(filtered_items)
+                    if table is not content_table:
+                        layout["content"].update(Panel(table))
+                        content_table = table
+                    self._dirty = False
                 
-                table = self._create_table(filtered_items)
-                layout["content"].update(Panel(table))
-                
-                if not self._handle_input(self._get_char(), live):
+                char = self._get_char()
+                if not char:
+                    time.sleep(0.01)
+                    continue
+
+                if not self._handle_input(char, live):
                     break
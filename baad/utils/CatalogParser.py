@@ -1,7 +1,15 @@
-import binascii
+import asyncio
 import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import xxhash
 from requests_cache import CachedSession
 from rich.console import Console
 from platformdirs import user_cache_dir
@@ -10,6 +18,8 @@ from .. import __app_name__, __app_author__
 from ..lib.CatalogDecrypter import CatalogDecrypter
 from .CatalogFetcher import catalog_url
 
+CHUNK_SIZE = 1 << 20
+
 
 class CatalogParser:
     def __init__(self, catalog_url: str | None = None, version: str | None = None):
@@ -19,32 +29,55 @@ class CatalogParser:
         self.console = Console()
         self.catalog_url = catalog_url or None
         self.version = version
+        self._json_cache: dict[Path, tuple[int, dict]] = {}
+        self._game_files_cache: tuple[tuple, dict] | None = None
+        self._session = CachedSession(cache_name=str(self.cache_dir / 'http_cache'), backend='sqlite', expire_after=3600)
 
     @staticmethod
     def _calculate_crc32(file_path: Path) -> int:
-        with open(file_path, 'rb') as f:
-            return binascii.crc32(f.read()) & 0xFFFFFFFF
-
-    @staticmethod
-    def _fetch_bytes(catalog: str, file: str, cache: str) -> bytes:
-        with CachedSession(cache, use_temp=True) as session:
-            response = session.get(f'{catalog}{file}')
-            if response.status_code != 200:
-                raise Exception(f"HTTP error {response.status_code}: {response.reason} for URL {catalog}{file}")
-            return response.content
-
-    @staticmethod
-    def _load_json(file_path: Path) -> dict:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        crc = 0
+        with open(file_path, 'rb', buffering=0) as f:
+            while chunk := f.read(CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+
+        return crc & 0xFFFFFFFF
+
+    @classmethod
+    async def _calculate_crc32_async(cls, file_path: Path) -> int:
+        return await asyncio.to_thread(cls._calculate_crc32, file_path)
+
+    def _fetch_bytes(self, catalog: str, file: str) -> bytes:
+        response = self._session.get(f'{catalog}{file}')
+        if response.status_code != 200:
+            raise Exception(f"HTTP error {response.status_code}: {response.reason} for URL {catalog}{file}")
+        return response.content
+
+    def _load_json(self, file_path: Path) -> dict:
+        mtime = file_path.stat().st_mtime_ns
+        cached = self._json_cache.get(file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        if orjson:
+            data = orjson.loads(file_path.read_bytes())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        self._json_cache[file_path] = (mtime, data)
+        return data
 
     @staticmethod
     def save_json(file_path: Path, data: dict) -> None:
+        if orjson:
+            file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+
         with open(file_path, 'w') as f:
             json.dump(data, f, indent=4)
 
     def _fetch_table_bytes(self, catalog: str) -> bytes:
-        return self._fetch_bytes(catalog, '/TableBundles/TableCatalog.bytes', 'tablebytes')
+        return self._fetch_bytes(catalog, '/TableBundles/TableCatalog.bytes')
 
     def _fetch_media_bytes(self, catalog: str) -> bytes:
         paths = [
@@ -54,25 +87,24 @@ class CatalogParser:
 
         for path in paths:
             try:
-                return self._fetch_bytes(catalog, path, 'mediabytes')
+                return self._fetch_bytes(catalog, path)
             except Exception:
                 continue
                 
         raise Exception("Failed to fetch media bytes from all available paths")
 
-    def _fetch_data(self, url: str, cache_name: str) -> dict:
-        with CachedSession(cache_name=cache_name, use_temp=True) as session:
-            try:
-                return session.get(url).json()
+    def _fetch_data(self, url: str) -> dict:
+        try:
+            return self._session.get(url).json()
 
-            except (ConnectionError, TimeoutError) as e:
-                self.console.log('[bold red]Error: Connection failed.[/bold red]')
-                raise SystemExit(1) from e
+        except (ConnectionError, TimeoutError) as e:
+            self.console.log('[bold red]Error: Connection failed.[/bold red]')
+            raise SystemExit(1) from e
 
     def fetch_catalog_url(self) -> str:
         if not self.catalog_url:
             server_api = catalog_url(self.version)
-            server_data = self._fetch_data(server_api, 'serverapi')
+            server_data = self._fetch_data(server_api)
             return server_data['ConnectionGroups'][0]['OverrideConnectionGroups'][-1]['AddressablesCatalogUrlRoot']
         
         if self.catalog_url.startswith(('http://', 'https://')):
@@ -83,33 +115,62 @@ class CatalogParser:
         
         return f'https://{self.catalog_url}'
 
+    def _fetch_bundle_catalog(self, server_url: str, platform: str) -> None:
+        bundle_data = self._fetch_data(f'{server_url}/{platform}/bundleDownloadInfo.json')
+        self.save_json(self.cache_dir / f'bundleDownloadInfo-{platform}.json', bundle_data)
+
+    def _decrypt_catalog(self, data: bytes, server_url: str, name: str, media: bool) -> None:
+        json_path = self.cache_dir / f'{name}.json'
+        hash_path = self.cache_dir / f'{name}.hash'
+        digest = xxhash.xxh3_64(data).hexdigest()
+
+        if json_path.exists() and hash_path.exists() and hash_path.read_text() == digest:
+            return
+
+        catalog = CatalogDecrypter.from_bytes(data, server_url, media=media)
+        catalog.to_json(json_path, media=media)
+        hash_path.write_text(digest)
+
+    def _fetch_table_catalog(self, server_url: str) -> None:
+        table_data = self._fetch_table_bytes(catalog=server_url)
+        self._decrypt_catalog(table_data, server_url, 'TableCatalog', media=False)
+
+    def _fetch_media_catalog(self, server_url: str) -> None:
+        media_data = self._fetch_media_bytes(catalog=server_url)
+        self._decrypt_catalog(media_data, server_url, 'MediaCatalog', media=True)
+
     def fetch_catalogs(self) -> None:
         server_url = self.fetch_catalog_url()
 
         self.console.print('[cyan]Fetching catalogs...[/cyan]')
 
-        android_bundle_data = self._fetch_data(f'{server_url}/Android/bundleDownloadInfo.json', 'catalogurl')
-        self.save_json(self.cache_dir / 'bundleDownloadInfo-Android.json', android_bundle_data)
-        ios_bundle_data = self._fetch_data(f'{server_url}/iOS/bundleDownloadInfo.json', 'catalogurl')
-        self.save_json(self.cache_dir / 'bundleDownloadInfo-iOS.json', ios_bundle_data)
-        
-        table_data = self._fetch_table_bytes(catalog=server_url)
-        table_catalog = CatalogDecrypter.from_bytes(table_data, server_url, media=False)
-        table_catalog.to_json(self.cache_dir / 'TableCatalog.json', media=False)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._fetch_bundle_catalog, server_url, 'Android'),
+                executor.submit(self._fetch_bundle_catalog, server_url, 'iOS'),
+                executor.submit(self._fetch_table_catalog, server_url),
+                executor.submit(self._fetch_media_catalog, server_url),
+            ]
 
-        media_data = self._fetch_media_bytes(catalog=server_url)
-        media_catalog = CatalogDecrypter.from_bytes(media_data, server_url, media=True)
-        media_catalog.to_json(self.cache_dir / 'MediaCatalog.json', media=True)
+            for future in as_completed(futures):
+                future.result()
 
     def get_game_files(self) -> dict:
         server_url = self.fetch_catalog_url()
 
-        android_bundle_data = self._load_json(self.cache_dir / 'bundleDownloadInfo-Android.json')
-        ios_bundle_data = self._load_json(self.cache_dir / 'bundleDownloadInfo-iOS.json')
-        table_data = self._load_json(self.cache_dir / 'TableCatalog.json')
-        media_data = self._load_json(self.cache_dir / 'MediaCatalog.json')
+        catalog_paths = [
+            self.cache_dir / 'bundleDownloadInfo-Android.json',
+            self.cache_dir / 'bundleDownloadInfo-iOS.json',
+            self.cache_dir / 'TableCatalog.json',
+            self.cache_dir / 'MediaCatalog.json',
+        ]
+        cache_key = (server_url, *(path.stat().st_mtime_ns for path in catalog_paths))
+        if self._game_files_cache and self._game_files_cache[0] == cache_key:
+            return self._game_files_cache[1]
+
+        android_bundle_data, ios_bundle_data, table_data, media_data = map(self._load_json, catalog_paths)
 
-        return {
+        game_files = {
             'AndroidAssetBundles': [
                 {
                     'url': f'{server_url}/Android/{asset["Name"]}',
@@ -144,8 +205,10 @@ class CatalogParser:
                 for key, value in media_data['MediaResources'].items()
             ],
         }
+        self._game_files_cache = (cache_key, game_files)
+        return game_files
 
     def fetch_version(self) -> str:
         server_index = 'https://prod-noticeindex.bluearchiveyostar.com/prod/index.json'
-        server_data = self._fetch_data(server_index, 'serverindex')
+        server_data = self._fetch_data(server_index)
         return server_data['LatestClientVersion']
@@ -14,5 +14,5 @@ class GlobalCatalogParser(CatalogParser):
 
     def fetch_resource_data(self) -> None:
         server_url = self.fetch_catalog_url()
-        resource_data = self._fetch_data(f"{server_url}/resource-data.json", 'resourcedata')
+        resource_data = self._fetch_data(f"{server_url}/resource-data.json")
         self.save_json(self.cache_dir / 'resource-data.json', resource_data)
\ No newline at end of file
@@ -1,51 +1,70 @@
+import os
 import asyncio
+import threading
 from pathlib import Path
 from zipfile import BadZipFile
 
-from rich.console import Console
 from ..lib.TableService import TableZipFile
+from .Progress import create_live_display, create_progress_group
 
 
 class MediaExtracter:
     def __init__(self, output: str) -> None:
         self.media_path = output or Path.cwd() / 'output' / 'MediaResources' / 'GameData' / 'Audio' / 'VOC_JP'
         self.extracted_path = Path(self.media_path).parent.parent.parent.parent / 'MediaExtracted' / 'GameData' / 'Audio' / 'VOC_JP'
-        self.console = Console()
+        self.semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        self.extract_task = None
+        self._extract_total = 0
+        self._total_lock = threading.Lock()
 
-    async def extract_media(self, media_file: Path | str) -> None:
-        try:
-            with TableZipFile(media_file) as tz:
-                file_list = tz.namelist()
-                media_dir_fp = self.extracted_path / media_file.stem
-                media_dir_fp.mkdir(parents=True, exist_ok=True)
+        self.live = create_live_display()
+        self.progress_group, _, self.extract_progress, self.print_progress, self.console = create_progress_group()
+
+    def _extract_sync(self, media_file: Path) -> None:
+        with TableZipFile(media_file) as tz:
+            file_list = tz.namelist()
+            media_dir_fp = self.extracted_path / media_file.stem
+            media_dir_fp.mkdir(parents=True, exist_ok=True)
 
-                self.console.print(f"[cyan]Extracting {media_file.name}...[/cyan]")
+            with self._total_lock:
+                self._extract_total += len(file_list)
+                self.extract_progress.update(self.extract_task, total=self._extract_total)
 
-                for name in file_list:
-                    data = tz.read(name)
-                    fp = media_dir_fp / name
-                    fp.parent.mkdir(parents=True, exist_ok=True)
-                    fp.write_bytes(data)
-                    self.console.print(f"[green]  Extracted: {name}[/green]")
+            for name in file_list:
+                data = tz.read(name)
+                fp = media_dir_fp / name
+                fp.parent.mkdir(parents=True, exist_ok=True)
+                fp.write_bytes(data)
+                self.extract_progress.advance(self.extract_task)
+
+    async def extract_media(self, media_file: Path | str) -> None:
+        media_file = Path(media_file)
+        try:
+            async with self.semaphore:
+                await asyncio.to_thread(self._extract_sync, media_file)
 
         except BadZipFile:
-            self.console.print(f'[red]Error: {media_file} is not a valid zip file.[/red]')
+            self.print_progress.add_task(f'[red]Error: {media_file} is not a valid zip file.[/red]')
             
         except RuntimeError as e:
-            self.console.print(f'[red]Error extracting {media_file}: {str(e)}[/red]')
+            self.print_progress.add_task(f'[red]Error extracting {media_file}: {str(e)}[/red]')
 
     async def extract_all_media(self) -> None:
         media_files = list(Path(self.media_path).glob('*.zip'))
         if not media_files:
-            self.console.print("[yellow]No media files found to extract[/yellow]")
+            self.print_progress.add_task("[yellow]No media files found to extract[/yellow]")
             return
 
-        self.console.print(f"[cyan]Found {len(media_files)} media archives to extract[/cyan]")
+        self.print_progress.add_task(f"[cyan]Found {len(media_files)} media archives to extract[/cyan]")
+        self.extract_task = self.extract_progress.add_task('[green]Extracting...', total=0)
         
         tasks = [self.extract_media(media_file) for media_file in media_files]
         await asyncio.gather(*tasks)
         
-        self.console.print("[green]All files have been extracted successfully![/green]")
+        self.extract_progress.update(self.extract_task, description='[green]Extracted...')
+        self.print_progress.add_task("[green]All files have been extracted successfully![/green]")
 
     def run_extraction(self) -> None:
-        asyncio.run(self.extract_all_media()) 
\ No newline at end of file
+        with self.live:
+            self.live.update(self.progress_group)
+            asyncio.run(self.extract_all_media())
@@ -1,14 +1,20 @@
 import asyncio
+import json
+import zlib
 from pathlib import Path
 
 import aiofiles
-from aiohttp import ClientError, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientSession, TCPConnector
 
 from .ApkParser import ApkParser
 from .CatalogParser import CatalogParser
 from .Progress import create_live_display, create_progress_group
 from .CatalogFilter import CatalogFilter
 
+RANGE_THRESHOLD = 16 << 20
+RANGE_COUNT = 4
+WRITE_BUFFER_SIZE = 4 << 20
+
 
 class ResourceDownloader:
     def __init__(self, update: bool = False, output: str | None = None, catalog_url: str | None = None, filter_pattern: str | None = None, version: str | None = None) -> None:
@@ -19,7 +25,8 @@ class ResourceDownloader:
         self.filter_pattern = filter_pattern
         self.version = version
 
-        self.semaphore = None
+        self.limit = 16
+        self.semaphore = asyncio.Semaphore(self.limit)
         self.catalog_parser = CatalogParser(catalog_url, version)
         self.categories = {
             'androidassets': 'AndroidAssetBundles',
@@ -44,7 +51,7 @@ class ResourceDownloader:
         if not file_path.exists():
             return False
 
-        if self.catalog_parser._calculate_crc32(file_path) != crc:
+        if await self.catalog_parser._calculate_crc32_async(file_path) != crc:
             return False
 
         self.console.print(f'[green]Skipping {file_path.name}, already downloaded.[/green]')
@@ -52,14 +59,14 @@ class ResourceDownloader:
 
     async def _download_file_content(
         self, session: ClientSession, url: str, fp: Path, size: int, retries: int = 3
-    ) -> bool:
+    ) -> int | None:
         for attempt in range(retries):
             try:
-                bytes_downloaded = await self._attempt_download(session, url, fp)
+                bytes_downloaded, expected_size, crc = await self._attempt_download(session, url, fp, size)
                 
-                if bytes_downloaded == size:
+                if expected_size is None or bytes_downloaded == expected_size:
                     self.console.print(f'[green]Successfully downloaded {fp.name}[/green]')
-                    return True
+                    return crc
                     
             except Exception as e:
                 self.console.log(f'[yellow]Error downloading {fp.name} {str(e)}[/yellow]')
@@ -68,24 +75,124 @@ class ResourceDownloader:
                 await asyncio.sleep(2**attempt)
                 
         self.console.log(f'[bold red]Failed to download {fp.name} after {retries} attempts.[/bold red]')
-        return False
+        return None
         
-    async def _attempt_download(self, session: ClientSession, url: str, fp: Path) -> int:
+    @staticmethod
+    def _load_completed_ranges(part_path: Path, fp: Path, size: int) -> list:
+        if not (fp.exists() and part_path.exists()):
+            return []
+
+        try:
+            part = json.loads(part_path.read_text())
+        except (OSError, ValueError):
+            return []
+
+        if part.get('size') != size:
+            return []
+
+        return [tuple(completed) for completed in part.get('ranges', [])]
+
+    async def _download_range(self, session: ClientSession, url: str, fp: Path, start: int, end: int, size: int) -> bool:
         bytes_downloaded = 0
-        
-        async with session.get(url) as response:
-            async with aiofiles.open(fp, 'wb') as f:
-                async for chunk in response.content.iter_chunked(8192):
-                    if not chunk:
-                        break
 
-                    await f.write(chunk)
+        async with session.get(url, headers={'Range': f'bytes={start}-{end}'}) as response:
+            response.raise_for_status()
+
+            if response.status != 206 or response.headers.get('Content-Range', '').rpartition('/')[2] != str(size):
+                return False
+
+            async with aiofiles.open(fp, 'r+b') as f:
+                await f.seek(start)
+                buffer = bytearray()
+
+                async for chunk in response.content.iter_chunked(65536):
+                    buffer += chunk
                     bytes_downloaded += len(chunk)
-                    
-        return bytes_downloaded
 
-    async def _verify_download(self, file_path: Path, crc: int) -> bool:
-        if self.catalog_parser._calculate_crc32(file_path) != crc:
+                    if len(buffer) >= WRITE_BUFFER_SIZE:
+                        await f.write(bytes(buffer))
+                        buffer.clear()
+
+                if buffer:
+                    await f.write(bytes(buffer))
+
+        if bytes_downloaded != end - start + 1:
+            raise ClientError(f'Incomplete range {start}-{end} for {fp.name}')
+
+        return True
+
+    async def _attempt_ranged_download(self, session: ClientSession, url: str, fp: Path, size: int) -> int | None:
+        part_path = fp.with_name(f'{fp.name}.part.json')
+        completed = self._load_completed_ranges(part_path, fp, size)
+
+        if not completed:
+            with open(fp, 'wb') as f:
+                f.truncate(size)
+
+        step = -(-size // RANGE_COUNT)
+        ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+        async def fetch_range(start: int, end: int) -> bool:
+            if not await self._download_range(session, url, fp, start, end, size):
+                return False
+
+            completed.append((start, end))
+            part_path.write_text(json.dumps({'size': size, 'ranges': completed}))
+            return True
+
+        results = await asyncio.gather(
+            *[fetch_range(start, end) for start, end in ranges if (start, end) not in completed],
+            return_exceptions=True
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        part_path.unlink(missing_ok=True)
+
+        if not all(results):
+            return None
+
+        return await self.catalog_parser._calculate_crc32_async(fp)
+
+    @staticmethod
+    async def _stream_download(response: ClientResponse, fp: Path) -> tuple[int, int]:
+        bytes_downloaded = 0
+        crc = 0
+
+        async with aiofiles.open(fp, 'wb') as f:
+            buffer = bytearray()
+
+            async for chunk in response.content.iter_chunked(65536):
+                if not chunk:
+                    break
+
+                crc = zlib.crc32(chunk, crc)
+                buffer += chunk
+                bytes_downloaded += len(chunk)
+
+                if len(buffer) >= WRITE_BUFFER_SIZE:
+                    await f.write(bytes(buffer))
+                    buffer.clear()
+
+            if buffer:
+                await f.write(bytes(buffer))
+
+        return bytes_downloaded, crc
+
+    async def _attempt_download(self, session: ClientSession, url: str, fp: Path, size: int) -> tuple[int, int | None, int]:
+        if size > RANGE_THRESHOLD:
+            crc = await self._attempt_ranged_download(session, url, fp, size)
+            if crc is not None:
+                return size, size, crc
+
+        async with session.get(url) as response:
+            bytes_downloaded, crc = await self._stream_download(response, fp)
+            return bytes_downloaded, response.content_length, crc
+
+    def _verify_download(self, file_path: Path, crc: int, downloaded_crc: int) -> bool:
+        if downloaded_crc != crc:
             self.console.log(f'[yellow]Hash mismatch for {file_path.name}, retrying...[/yellow]')
             file_path.unlink(missing_ok=True)
             return False
@@ -93,54 +200,46 @@ class ResourceDownloader:
         return True
 
     async def _download_file(
-        self, session: ClientSession, url: str, file_path: Path, crc: int, retries: int = 3
+        self, session: ClientSession, url: str, file_path: Path, crc: int, size: int = 0, retries: int = 3
     ) -> None:
         if await self._check_existing_file(file_path, crc):
             return
 
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        total_size = await self.get_file_size(session, url)
 
-        if total_size is None:
-            self.console.log(f'[bold red]Failed to get file size for {url}[/bold red]')
-            return
-
-        download_success = await self._download_file_content(session, url, file_path, total_size, retries)
-        if not download_success:
+        downloaded_crc = await self._download_file_content(session, url, file_path, size, retries)
+        if downloaded_crc is None:
             return
             
-        verify_success = await self._verify_download(file_path, crc)
+        verify_success = self._verify_download(file_path, crc, downloaded_crc)
         if not verify_success:
             return
 
-    async def _download_category(self, files: list, base_path: Path) -> None:
-        async with ClientSession() as session:
-            tasks = [
-                self._download_file(
-                    session,
-                    file['url'],
-                    base_path / self._get_file_path(file),
-                    file['crc'],
-                )
-                for file in files
-            ]
-            await asyncio.gather(*tasks)
+    async def _bounded_download_file(self, session: ClientSession, url: str, file_path: Path, crc: int, size: int) -> None:
+        async with self.semaphore:
+            await self._download_file(session, url, file_path, crc, size)
 
-    async def _download_all_categories(self, game_files: dict, categories: list) -> None:
-        for category, files in game_files.items():
-            if category in categories:
-                await self._download_category(files, Path(self.output) / category)
+    async def _download_category(self, session: ClientSession, files: list, base_path: Path) -> None:
+        tasks = [
+            self._bounded_download_file(
+                session,
+                file['url'],
+                base_path / self._get_file_path(file),
+                file['crc'],
+                file.get('size') or file.get('bytes', 0),
+            )
+            for file in files
+        ]
+        await asyncio.gather(*tasks)
 
-    async def get_file_size(self, session: ClientSession, url: str) -> int | None:
-        for i in range(10):
-            try:
-                async with session.head(url, allow_redirects=True) as response:
-                    return int(response.headers.get('Content-Length', 0))
+    async def _download_all_categories(self, game_files: dict, categories: list) -> None:
+        pool_size = self.limit * RANGE_COUNT if self.limit else 0
+        connector = TCPConnector(limit=pool_size, limit_per_host=pool_size, ttl_dns_cache=300)
 
-            except (ClientError, ValueError):
-                return None
-            except TimeoutError:
-                continue
+        async with ClientSession(connector=connector) as session:
+            for category, files in game_files.items():
+                if category in categories:
+                    await self._download_category(session, files, Path(self.output) / category)
 
     def initialize_download(self) -> dict:
         self.fetch_catalog_url()
@@ -171,6 +270,7 @@ class ResourceDownloader:
             self.categories[cat] for cat, enabled in [('androidassets', androidassets), ('iosassets', iosassets), ('table', tables), ('media', media)] if enabled
         ]
 
+        self.limit = limit
         self.semaphore = asyncio.Semaphore(limit if limit is not None else float('inf'))
         asyncio.run(self._download_all_categories(game_files, categories))
 